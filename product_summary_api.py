@@ -1,39 +1,139 @@
+import asyncio
+import hashlib
 import json
 import os
+import re
+import tempfile
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from itertools import chain, islice
 from pathlib import Path
-from typing import List, Dict, Any, Union
+from typing import List, Dict, Any, AsyncIterable, AsyncIterator, Iterable, Iterator, Optional, Tuple, Union
 import streamlit as st
+import ijson
 import ollama
+import orjson
 from langchain_core.documents import Document
 
 # Previous imports and constants remain the same...
 
+_BULLET_RE = re.compile(r'^[ \t]*[•\-\*]+[ \t]*(\S.*?)[ \t\r]*$', re.MULTILINE)
+
+# Integer literals of 20+ digits may exceed orjson's 64-bit range, which it silently turns into floats
+_BIG_INT_RE = re.compile(rb'\d{20,}')
+
+ERROR_SUMMARY = ["Error generating summary"]
+
+SUMMARY_PROMPT = 'Summarize the product below as 3-5 concise bullet points. Respond with JSON of the form {{"bullets": ["...", ...]}}.\n\n{product_info}'
+
+STREAM_SUMMARY_PROMPT = "Summarize the product below as 3-5 concise bullet points, one per line, each starting with '- '.\n\n{product_info}"
+
+BATCH_SUMMARY_PROMPT = 'Summarize each product below as 3-5 concise bullet points. Respond with JSON of the form {{"products": [{{"id": 1, "bullets": ["...", ...]}}, ...]}} containing one entry per product, where id is the number of the product it summarizes.\n\n{products_info}'
+
+# Cap generation length; summaries are short, so decoding past ~200 tokens per product is wasted work
+SUMMARY_OPTIONS = {"num_predict": 200, "temperature": 0.2, "stop": ["\n\n\n", "###"]}
+
+
+def _dumps(obj: Any, option: Optional[int] = None) -> bytes:
+    """Serialize with orjson, falling back to the stdlib for integers beyond 64 bits."""
+    try:
+        return orjson.dumps(obj, option=option)
+    except TypeError:
+        indent = 2 if option and option & orjson.OPT_INDENT_2 else None
+        return json.dumps(
+            obj,
+            indent=indent,
+            sort_keys=bool(option and option & orjson.OPT_SORT_KEYS),
+            separators=None if indent else (",", ":"),
+            ensure_ascii=False,
+        ).encode('utf-8')
+
+
+@st.cache_resource(ttl="30m", show_spinner=False)
+def _warm_up_model(host: str, _client: ollama.Client) -> None:
+    """Load the summary model into the Ollama server at `host` with a one-token request.
+
+    Cached per host for as long as the request's keep_alive holds the model, so repeated runs
+    don't repeat the warm-up but it runs again once the server may have unloaded the model.
+    Failures raise and are not cached. `_client` is excluded from the cache key.
+    """
+    _client.chat(
+        model="llama3.2:3b",
+        messages=[{"role": "user", "content": "ok"}],
+        options={"num_predict": 1},
+        keep_alive="30m",
+    )
+
+
+def _iter_array_items(src: Any, backend: Any = ijson) -> Iterator[Any]:
+    """Return an iterator over the items of the top-level JSON array in a binary file."""
+    events = backend.parse(src, use_float=True)
+    first = next(events, None)
+    if first is None or first[1] != 'start_array':
+        raise ValueError("JSON content must be a list of products")
+    return backend.items(chain([first], events), 'item')
+
+
+def _read_window(items: Iterable[Any], size: int) -> List[Any]:
+    """Pull the next `size` items from a (blocking) iterator."""
+    return list(islice(items, size))
+
+
+async def _abatched(iterable: AsyncIterable[Any], size: int) -> AsyncIterator[List[Any]]:
+    """Group items from an async iterable into lists of at most `size` items."""
+    batch = []
+    async for item in iterable:
+        batch.append(item)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
 class ProductProcessor:
+    # Product fields that carry summary-relevant information; everything else is left out of the prompt
+    SUMMARY_FIELDS = ("name", "title", "brand", "category", "features", "specifications", "description", "price")
+    # Summaries kept in memory for hot reuse; older ones are still served from the on-disk cache
+    MEMORY_CACHE_SIZE = 4096
+
     def __init__(self):
-        self.llm = LLMProcessor()
+        self.host = os.getenv("OLLAMA_HOST", "http://localhost:11434")
+        self.client = ollama.Client(host=self.host)
+        self._async_client = None
+        self._semaphore = None
+        self._bound_loop = None
+        self.cache_dir = Path(".summary_cache")
+        self._summary_cache: "OrderedDict[str, List[str]]" = OrderedDict()
+        self._cache_write_warned = False
     
-    def process_json_document(self, json_content: str) -> Dict[str, Any]:
+    def warm_up(self) -> None:
+        """Load the model before a processing run so its load cost isn't charged to the first batch."""
+        try:
+            _warm_up_model(self.host, self.client)
+        except Exception as e:
+            st.warning(f"Could not preload model: {str(e)}")
+
+    def process_json_document(self, json_content: Union[str, bytes]) -> Dict[str, Any]:
         """Process JSON document and add AI summaries for each product."""
+        return self.add_summaries(self.load_products(json_content))
+
+    def load_products(self, json_content: Union[str, bytes]) -> List[Any]:
+        """Parse JSON content into a list of products."""
         try:
-            # Parse JSON content
-            products = json.loads(json_content)
+            # Parse JSON content; the stdlib parser keeps oversized integers (e.g. long SKUs) exact
+            if isinstance(json_content, str):
+                json_content = json_content.encode('utf-8')
+            if _BIG_INT_RE.search(json_content):
+                products = json.loads(json_content)
+            else:
+                products = orjson.loads(json_content)
             
             # Ensure we have a list of products
             if not isinstance(products, list):
                 raise ValueError("JSON content must be a list of products")
             
-            # Process each product
-            for i, product in enumerate(products, 1):
-                if not isinstance(product, dict):
-                    continue
-                    
-                # Show progress
-                st.progress(i / len(products), f"Processing product {i} of {len(products)}")
-                    
-                # Generate AI summary for the product
-                summary = self._generate_product_summary(product)
-                product['ai_summary'] = summary
-            
             return products
             
         except json.JSONDecodeError as e:
@@ -42,13 +142,201 @@ class ProductProcessor:
         except Exception as e:
             st.error(f"Error processing products: {str(e)}")
             raise
+
+    def add_summaries(self, products: List[Any]) -> List[Any]:
+        """Add AI summaries to each product in the list."""
+        try:
+            self.warm_up()
+
+            # Summarize products concurrently, bounded by the server's parallel slots
+            product_dicts = [product for product in products if isinstance(product, dict)]
+            summaries = self._generate_summaries_batch(product_dicts)
+            for product, summary in zip(product_dicts, summaries):
+                product['ai_summary'] = summary
+            
+            return products
+            
+        except Exception as e:
+            st.error(f"Error processing products: {str(e)}")
+            raise
+
+    def stream_product_summary(self, product: Dict[str, Any]) -> List[str]:
+        """Generate an AI summary for a single product, rendering bullets as they stream in."""
+        key = self._cache_key(product)
+        cached = self._load_cached_summary(key)
+        if cached is not None:
+            st.markdown("\n".join(f"- {point}" for point in cached))
+            return cached
+
+        self.warm_up()
+        try:
+            summary_text = st.write_stream(self._stream_summary_lines(product))
+            bullet_points = _BULLET_RE.findall(summary_text)
+        except Exception as e:
+            st.error(f"Error generating summary for product: {str(e)}")
+            return ERROR_SUMMARY
+
+        # Cached so the bulk pass over the same products does not summarize them again
+        if bullet_points:
+            self._store_cached_summary(key, bullet_points)
+        return bullet_points
+
+    def _stream_summary_lines(self, product: Dict[str, Any]) -> Iterator[str]:
+        """Stream a plain-text bullet summary from the LLM, yielding one complete line at a time."""
+        product_info = _dumps(self._project_product(product)).decode()
+        response = self.client.chat(
+            model="llama3.2:3b",
+            stream=True,
+            messages=[
+                {
+                    "role": "system",
+                    "content": "You are a product analysis assistant. Create concise, bullet-point summaries of product features.",
+                },
+                {
+                    "role": "user",
+                    "content": STREAM_SUMMARY_PROMPT.format(product_info=product_info),
+                },
+            ],
+            options=SUMMARY_OPTIONS,
+            keep_alive="30m",
+        )
+
+        # Buffer tokens until a newline so each bullet renders as a whole markdown line
+        buffer = ""
+        for chunk in response:
+            buffer += chunk["message"]["content"]
+            *lines, buffer = buffer.split("\n")
+            for line in lines:
+                yield line + "\n"
+        if buffer:
+            yield buffer
     
-    def _generate_product_summary(self, product: Dict[str, Any]) -> List[str]:
+    async def process_stream(self, product_iter: AsyncIterable[Any], batch_size: int = 6) -> AsyncIterator[Any]:
+        """Add AI summaries to products from an async iterator, yielding each product once summarized.
+
+        Products are pulled one window at a time (enough to fill every parallel slot with a
+        batch), so memory use stays bounded regardless of how many products the iterator yields.
+        """
+        window_size = batch_size * int(os.getenv("OLLAMA_NUM_PARALLEL", "4"))
+
+        async for window in _abatched(product_iter, window_size):
+            product_dicts = [product for product in window if isinstance(product, dict)]
+            summaries = await self._agenerate_summaries(product_dicts, batch_size, show_progress=False)
+            for product, summary in zip(product_dicts, summaries):
+                product['ai_summary'] = summary
+
+            for product in window:
+                yield product
+
+    def _generate_summaries_batch(
+        self, products: List[Dict[str, Any]], batch_size: int = 6, show_progress: bool = True
+    ) -> List[List[str]]:
+        """Generate AI summaries for products, packing `batch_size` products into each LLM call."""
+        async def run() -> List[List[str]]:
+            try:
+                return await self._agenerate_summaries(products, batch_size, show_progress)
+            finally:
+                await self.aclose()
+
+        return asyncio.run(run())
+
+    async def _agenerate_summaries(
+        self, products: List[Dict[str, Any]], batch_size: int, show_progress: bool
+    ) -> List[List[str]]:
+        """Summarize uncached product batches concurrently, updating progress as each batch completes."""
+        self._bind_event_loop()
+        semaphore = self._semaphore
+
+        # Only products without a cached summary are sent to the LLM
+        keys = [self._cache_key(product) for product in products]
+        summaries = await self._aload_cached_summaries(keys)
+        pending = [i for i, summary in enumerate(summaries) if summary is None]
+        completed = len(products) - len(pending)
+        progress_bar = None
+        if show_progress and products:
+            # Start from the cached share so a fully cached run still shows as complete
+            progress_bar = st.progress(completed / len(products), f"Processing {completed}/{len(products)}")
+
+        # Each progress update is a round-trip to the frontend, so report at most ~20 times per run
+        step = max(1, len(products) // 20)
+        reported = 0
+
+        async def bounded(indices: List[int]):
+            async with semaphore:
+                return indices, await self._agenerate_batch_summary([products[i] for i in indices])
+
+        batches = [bounded(pending[i:i + batch_size]) for i in range(0, len(pending), batch_size)]
+        for future in asyncio.as_completed(batches):
+            indices, batch_summaries = await future
+            for index, summary in zip(indices, batch_summaries):
+                summaries[index] = summary
+            await self._astore_cached_summaries([
+                (keys[index], summary)
+                for index, summary in zip(indices, batch_summaries)
+                if summary and summary != ERROR_SUMMARY
+            ])
+            completed += len(batch_summaries)
+            if progress_bar is not None and (completed - reported >= step or completed == len(products)):
+                progress_bar.progress(completed / len(products), f"Processing {completed}/{len(products)}")
+                reported = completed
+
+        return summaries
+
+    async def _agenerate_batch_summary(self, products: List[Dict[str, Any]]) -> List[List[str]]:
+        """Generate AI summaries for a batch of products with a single LLM call."""
+        try:
+            products_info = "\n\n".join(
+                f"Product {i}: {_dumps(self._project_product(product)).decode()}" for i, product in enumerate(products, 1)
+            )
+
+            response = await self._get_async_client().chat(
+                model="llama3.2:3b",
+                messages=[
+                    {
+                        "role": "system",
+                        "content": "You are a product analysis assistant. Create concise, bullet-point summaries of product features.",
+                    },
+                    {
+                        "role": "user",
+                        "content": BATCH_SUMMARY_PROMPT.format(products_info=products_info),
+                    },
+                ],
+                format="json",
+                options={**SUMMARY_OPTIONS, "num_predict": SUMMARY_OPTIONS["num_predict"] * len(products)},
+                keep_alive="30m",
+            )
+
+            # Match entries to products by their id, never by position, so a skipped or extra
+            # entry cannot shift summaries onto the wrong products
+            entries = [entry for entry in orjson.loads(response['message']['content'])['products'] if isinstance(entry, dict)]
+            id_counts = Counter(entry.get('id') for entry in entries)
+            sections = {}
+            for entry in entries:
+                product_id = entry.get('id')
+                if not isinstance(product_id, int) or not 1 <= product_id <= len(products) or id_counts[product_id] > 1:
+                    continue
+                try:
+                    sections[product_id] = self._parse_bullets(entry)
+                except (KeyError, ValueError):
+                    continue
+
+        except Exception as e:
+            st.error(f"Error generating summaries for product batch: {str(e)}")
+            sections = {}
+
+        # Fall back to individual calls for any product the batch response missed
+        summaries = []
+        for i, product in enumerate(products, 1):
+            summary = sections.get(i) or await self._agenerate_product_summary(product)
+            summaries.append(summary)
+        return summaries
+
+    async def _agenerate_product_summary(self, product: Dict[str, Any]) -> List[str]:
         """Generate an AI summary for a single product."""
         try:
-            product_info = json.dumps(product, indent=2)
+            product_info = _dumps(self._project_product(product)).decode()
             
-            response = ollama.chat(
+            response = await self._get_async_client().chat(
                 model="llama3.2:3b",
                 messages=[
                     {
@@ -60,28 +348,171 @@ class ProductProcessor:
                         "content": SUMMARY_PROMPT.format(product_info=product_info),
                     },
                 ],
+                format="json",
+                options=SUMMARY_OPTIONS,
+                keep_alive="30m",
             )
             
-            summary_text = response['message']['content']
-            bullet_points = [
-                point.strip().lstrip('•-*').strip()
-                for point in summary_text.split('\n')
-                if point.strip() and point.strip()[0] in '•-*'
-            ]
-            
-            return bullet_points
+            return self._parse_bullets(orjson.loads(response['message']['content']))
             
         except Exception as e:
             st.error(f"Error generating summary for product: {str(e)}")
-            return ["Error generating summary"]
+            return ERROR_SUMMARY
+
+    @classmethod
+    def _project_product(cls, product: Dict[str, Any]) -> Dict[str, Any]:
+        """Reduce a product to the fields used for summarization, shortening long descriptions."""
+        slim = {k: product[k] for k in cls.SUMMARY_FIELDS if k in product}
+        description = slim.get("description")
+        if isinstance(description, str) and len(description) > 500:
+            # Slice rather than word-wrap, so text without spaces (CJK, URLs) is kept rather than dropped
+            slim["description"] = description[:500] + "..."
+        # Products without any known field are sent as-is rather than as an empty object
+        return slim or product
+
+    @classmethod
+    def _cache_key(cls, product: Dict[str, Any]) -> str:
+        """Return a stable content hash for the summary-relevant part of a product."""
+        slim = cls._project_product(product)
+        return hashlib.blake2b(_dumps(slim, option=orjson.OPT_SORT_KEYS), digest_size=16).hexdigest()
+
+    def _load_cached_summary(self, key: str) -> Optional[List[str]]:
+        """Return a previously generated summary from memory or the on-disk cache, if any."""
+        summary = self._recall_summary(key)
+        if summary is None:
+            summary = self._read_cache_file(key)
+            if summary is not None:
+                self._remember_summary(key, summary)
+        return summary
+
+    async def _aload_cached_summaries(self, keys: List[str]) -> List[Optional[List[str]]]:
+        """Look up cached summaries for `keys`, reading cache files off the event loop."""
+        summaries = [self._recall_summary(key) for key in keys]
+        misses = [i for i, summary in enumerate(summaries) if summary is None]
+        if misses:
+            loop = asyncio.get_running_loop()
+            from_disk = await loop.run_in_executor(None, lambda: [self._read_cache_file(keys[i]) for i in misses])
+            for i, summary in zip(misses, from_disk):
+                if summary is not None:
+                    summaries[i] = summary
+                    self._remember_summary(keys[i], summary)
+        return summaries
+
+    def _store_cached_summary(self, key: str, summary: List[str]) -> None:
+        """Save a generated summary to memory and the on-disk cache."""
+        self._remember_summary(key, summary)
+        if not self._write_cache_file(key, summary):
+            self._warn_cache_write_failed()
+
+    async def _astore_cached_summaries(self, entries: List[Tuple[str, List[str]]]) -> None:
+        """Save generated summaries to memory and the on-disk cache, writing files off the event loop."""
+        if not entries:
+            return
+        for key, summary in entries:
+            self._remember_summary(key, summary)
+
+        loop = asyncio.get_running_loop()
+        written = await loop.run_in_executor(None, lambda: [self._write_cache_file(key, summary) for key, summary in entries])
+        if not all(written):
+            self._warn_cache_write_failed()
+
+    def _read_cache_file(self, key: str) -> Optional[List[str]]:
+        """Read a summary from the on-disk cache; anything missing or unreadable counts as a miss."""
+        try:
+            summary = orjson.loads((self.cache_dir / f"{key}.json").read_bytes())
+        except (OSError, orjson.JSONDecodeError):
+            return None
+        if not isinstance(summary, list) or not summary:
+            return None
+        return summary
+
+    def _write_cache_file(self, key: str, summary: List[str]) -> bool:
+        """Write a summary to the on-disk cache, returning False if the cache is not writable."""
+        try:
+            self.cache_dir.mkdir(exist_ok=True)
+            # Write to a temp file and rename so readers never see a partially written entry
+            fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        except OSError:
+            return False
+
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(orjson.dumps(summary))
+            os.replace(temp_path, self.cache_dir / f"{key}.json")
+            return True
+        except OSError:
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
+            return False
+
+    def _warn_cache_write_failed(self) -> None:
+        """Warn once per processor that summaries are not being persisted."""
+        # The cache is only an optimisation, so a failed write never interrupts processing
+        if not self._cache_write_warned:
+            st.warning(f"Could not write to summary cache at {self.cache_dir}; continuing without it")
+            self._cache_write_warned = True
+
+    def _recall_summary(self, key: str) -> Optional[List[str]]:
+        """Return a summary from the in-memory cache, marking it as recently used."""
+        if key in self._summary_cache:
+            self._summary_cache.move_to_end(key)
+            return self._summary_cache[key]
+        return None
+
+    def _remember_summary(self, key: str, summary: List[str]) -> None:
+        """Add a summary to the in-memory cache, evicting the least recently used entry when full."""
+        self._summary_cache[key] = summary
+        self._summary_cache.move_to_end(key)
+        if len(self._summary_cache) > self.MEMORY_CACHE_SIZE:
+            self._summary_cache.popitem(last=False)
+
+    def _bind_event_loop(self) -> None:
+        """Create the AsyncClient and concurrency semaphore for the running event loop."""
+        # httpx connection pools and semaphores are bound to the loop they were created on,
+        # and every asyncio.run() call starts a fresh loop, so both are rebuilt once per loop.
+        # Within a loop they are shared, so concurrent files stay within OLLAMA_NUM_PARALLEL.
+        loop = asyncio.get_running_loop()
+        if self._bound_loop is not loop:
+            self._async_client = ollama.AsyncClient(host=self.host)
+            self._semaphore = asyncio.Semaphore(int(os.getenv("OLLAMA_NUM_PARALLEL", "4")))
+            self._bound_loop = loop
+
+    async def aclose(self) -> None:
+        """Close the AsyncClient bound to the running event loop; call before the loop ends."""
+        if self._async_client is not None:
+            # ollama.AsyncClient exposes no close method, so close its httpx client directly
+            await self._async_client._client.aclose()
+        self._async_client = None
+        self._semaphore = None
+        self._bound_loop = None
+
+    def _get_async_client(self) -> ollama.AsyncClient:
+        """Return the AsyncClient for the running event loop, reusing its connection pool across calls."""
+        self._bind_event_loop()
+        return self._async_client
+
+    @staticmethod
+    def _parse_bullets(entry: Dict[str, Any]) -> List[str]:
+        """Extract the non-empty bullet strings from a decoded {"bullets": [...]} response."""
+        bullets = entry['bullets']
+        if not isinstance(bullets, list):
+            raise ValueError(f"Expected a list of bullets, got {type(bullets).__name__}")
+        return [str(bullet).strip() for bullet in bullets if str(bullet).strip()]
 
 class FolderProcessor:
+    # Number of products parsed per read-ahead step
+    READ_WINDOW = 64
+
     def __init__(self, folder_path: str):
         self.folder_path = Path(folder_path)
         self.product_processor = ProductProcessor()
+        # Disk reads, JSON parsing and writes run here so they never block the event loop
+        self._io_pool = ThreadPoolExecutor(max_workers=2)
     
-    def process_folder(self) -> Dict[str, Any]:
-        """Process all JSON files in the specified folder."""
+    async def process_folder(self) -> Dict[str, Any]:
+        """Process all JSON files in the specified folder concurrently."""
         try:
             results = {}
             json_files = list(self.folder_path.glob("*.json"))
@@ -90,77 +521,140 @@ class FolderProcessor:
                 st.warning(f"No JSON files found in {self.folder_path}")
                 return results
             
-            for json_file in json_files:
-                st.write(f"Processing {json_file.name}...")
-                
-                try:
-                    with open(json_file, 'r', encoding='utf-8') as f:
-                        json_content = f.read()
-                        
-                    processed_products = self.product_processor.process_json_document(json_content)
-                    
-                    # Save processed file
-                    output_path = self.folder_path / f"processed_{json_file.name}"
-                    with open(output_path, 'w', encoding='utf-8') as f:
-                        json.dump(processed_products, f, indent=2)
-                    
-                    results[json_file.name] = {
-                        'status': 'success',
-                        'output_path': str(output_path),
-                        'product_count': len(processed_products)
-                    }
-                    
-                except Exception as e:
+            self.product_processor.warm_up()
+            
+            # Each file holds open input/output handles while it runs, and the LLM semaphore already
+            # caps throughput, so only as many files as there are parallel slots run at once
+            file_slots = asyncio.Semaphore(int(os.getenv("OLLAMA_NUM_PARALLEL", "4")))
+
+            async def bounded(json_file: Path) -> Dict[str, Any]:
+                async with file_slots:
+                    return await self._process_one_file(json_file)
+
+            tasks = [asyncio.create_task(bounded(json_file)) for json_file in json_files]
+            outcomes = await asyncio.gather(*tasks, return_exceptions=True)
+            
+            for json_file, outcome in zip(json_files, outcomes):
+                if isinstance(outcome, Exception):
                     results[json_file.name] = {
                         'status': 'error',
-                        'error': str(e)
+                        'error': str(outcome)
                     }
-                    st.error(f"Error processing {json_file.name}: {str(e)}")
+                    st.error(f"Error processing {json_file.name}: {str(outcome)}")
+                else:
+                    results[json_file.name] = outcome
             
             return results
             
         except Exception as e:
             st.error(f"Error processing folder: {str(e)}")
             raise
+        finally:
+            await self.product_processor.aclose()
+            self._io_pool.shutdown(wait=False)
+
+    async def _process_one_file(self, json_file: Path) -> Dict[str, Any]:
+        """Summarize the products in a single JSON file and write the processed copy."""
+        status = st.empty()
+        status.write(f"Processing {json_file.name}...")
+        output_path = self.folder_path / f"processed_{json_file.name}"
+        
+        try:
+            product_count = await self._write_processed_file(json_file, output_path, status, ijson)
+        except ijson.JSONError as e:
+            # The default C backend rejects integers beyond 64 bits; the pure-Python one keeps them
+            # exact. Products summarized before the failure come from the summary cache on retry.
+            if "integer overflow" not in str(e):
+                raise
+            python_backend = ijson.get_backend("python")
+            product_count = await self._write_processed_file(json_file, output_path, status, python_backend)
+        
+        return {
+            'status': 'success',
+            'output_path': str(output_path),
+            'product_count': product_count
+        }
+
+    async def _write_processed_file(self, json_file: Path, output_path: Path, status: Any, backend: Any) -> int:
+        """Stream a JSON file's products through summarization into output_path, returning the count."""
+        loop = asyncio.get_running_loop()
+        
+        # Stream products in and out so neither file is fully held in memory. Output goes to a
+        # temp file that only replaces output_path once the whole input has been processed.
+        fd, temp_path = tempfile.mkstemp(dir=self.folder_path, prefix=f".{output_path.name}.", suffix=".tmp")
+        product_count = 0
+        pending_output = [b"["]
+        try:
+            with os.fdopen(fd, 'wb') as dst:
+                async for product in self.product_processor.process_stream(self._iter_products(json_file, backend)):
+                    separator = b",\n" if product_count else b"\n"
+                    # Compact output, one product per line: indenting inflates both write time and file size
+                    pending_output.append(separator + _dumps(product))
+                    product_count += 1
+                    if len(pending_output) >= self.READ_WINDOW:
+                        await loop.run_in_executor(self._io_pool, dst.write, b"".join(pending_output))
+                        pending_output.clear()
+                    if product_count % 100 == 0:
+                        status.write(f"Processing {json_file.name}... {product_count} products")
+                pending_output.append(b"\n]\n")
+                await loop.run_in_executor(self._io_pool, dst.write, b"".join(pending_output))
+            os.replace(temp_path, output_path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+        
+        return product_count
+
+    async def _iter_products(self, json_file: Path, backend: Any = ijson) -> AsyncIterator[Any]:
+        """Yield products from a JSON file, parsing the next window on the I/O pool while this one is used."""
+        loop = asyncio.get_running_loop()
+        with open(json_file, 'rb') as src:
+            items = await loop.run_in_executor(self._io_pool, _iter_array_items, src, backend)
+            read_window = partial(_read_window, items, self.READ_WINDOW)
+            pending = loop.run_in_executor(self._io_pool, read_window)
+            try:
+                while window := await pending:
+                    pending = loop.run_in_executor(self._io_pool, read_window)
+                    for product in window:
+                        yield product
+            finally:
+                # Let an in-flight read finish before the file is closed under it
+                await asyncio.wait([pending])
 
 class RAGApplication:
     def __init__(self):
         self.product_processor = ProductProcessor()
-        self.vector_store = VectorStore()
     
     def process_json_file(self, json_content: Union[str, bytes]) -> None:
         """Process JSON content and add AI summaries."""
         try:
-            # Convert bytes to string if needed
-            if isinstance(json_content, bytes):
-                json_content = json_content.decode('utf-8')
-            
-            # Process products and add summaries
-            processed_products = self.product_processor.process_json_document(json_content)
+            products = self.product_processor.load_products(json_content)
             
-            # Create download button for processed JSON
-            processed_json = json.dumps(processed_products, indent=2)
-            st.download_button(
-                label="Download Processed JSON",
-                data=processed_json,
-                file_name="processed_products.json",
-                mime="application/json"
-            )
-            
-            # Display sample results
-            st.success("Products processed successfully!")
+            # Stream sample summaries so results appear before the bulk run finishes
             st.subheader("Sample Results")
-            for idx, product in enumerate(processed_products[:3], 1):
-                st.write(f"\nProduct {idx}:")
+            samples = [product for product in products if isinstance(product, dict)][:3]
+            for idx, product in enumerate(samples, 1):
+                st.write(f"Product {idx}:")
                 st.json(product)
                 
                 st.write("AI Summary:")
-                for point in product['ai_summary']:
-                    st.write(f"• {point}")
+                self.product_processor.stream_product_summary(product)
                 
-                if idx < len(processed_products):
+                if idx < len(samples):
                     st.markdown("---")
             
+            # Summarize all products; the streamed samples are served from the summary cache
+            processed_products = self.product_processor.add_summaries(products)
+            st.success("Products processed successfully!")
+            
+            # Create download button for processed JSON, serialized once straight to bytes
+            st.download_button(
+                label="Download Processed JSON",
+                data=_dumps(processed_products, option=orjson.OPT_INDENT_2),
+                file_name="processed_products.json",
+                mime="application/json"
+            )
+            
             if len(processed_products) > 3:
                 st.info(f"{len(processed_products) - 3} more products processed. Download the JSON file to see all results.")
                 
@@ -203,7 +697,7 @@ def main():
             else:
                 with st.spinner("Processing files in folder..."):
                     folder_processor = FolderProcessor(folder_path)
-                    results = folder_processor.process_folder()
+                    results = asyncio.run(folder_processor.process_folder())
                     
                     # Display results summary
                     st.subheader("Processing Results")